@@ -31,6 +31,33 @@ from OMPython.modelica_doe_omc import (
 # define logger using the current module name as ID
 logger = logging.getLogger(__name__)
 
+_IS_WINDOWS: bool = platform.system() == "Windows"
+_EXE_SUFFIX: str = ".exe" if _IS_WINDOWS else ""
+
+
+def _initial_values2str(
+        retval: dict[str, np.float64] | list[np.float64],
+) -> dict[str, Optional[str]] | list[Optional[str]]:
+    """
+    Convert the (initial) values as returned by get*Initial() to the string representation used by OMPython v4.0.0;
+    NaN values are converted to None. The check for NaN and the conversion to string is done for all values at once.
+    """
+    if not isinstance(retval, (dict, list)):
+        raise ModelExecutionException("Invalid data!")
+    if not retval:
+        return {} if isinstance(retval, dict) else []
+
+    values = retval.values() if isinstance(retval, dict) else retval
+    vals = np.fromiter(values, dtype=np.float64, count=len(retval))
+    # tolist() converts all elements to Python objects at once (bool / str)
+    mask = np.isnan(vals).tolist()
+    strs = vals.astype(str).tolist()
+
+    values_str = [None if isnan else val for isnan, val in zip(mask, strs)]
+    if isinstance(retval, dict):
+        return dict(zip(retval, values_str))
+    return values_str
+
 
 class ModelicaSystem(ModelicaSystemOMC):
     """
@@ -123,24 +150,7 @@ class ModelicaSystem(ModelicaSystemOMC):
         if self._simulated:
             return retval
 
-        if isinstance(retval, dict):
-            retval2: dict = {}
-            for key, val in retval.items():
-                if np.isnan(val):
-                    retval2[key] = None
-                else:
-                    retval2[key] = str(val)
-            return retval2
-        if isinstance(retval, list):
-            retval3: list[str | None] = []
-            for val in retval:
-                if np.isnan(val):
-                    retval3.append(None)
-                else:
-                    retval3.append(str(val))
-            return retval3
-
-        raise ModelExecutionException("Invalid data!")
+        return _initial_values2str(retval=retval)
 
     def getOutputs(
             self,
@@ -150,24 +160,7 @@ class ModelicaSystem(ModelicaSystemOMC):
         if self._simulated:
             return retval
 
-        if isinstance(retval, dict):
-            retval2: dict = {}
-            for key, val in retval.items():
-                if np.isnan(val):
-                    retval2[key] = None
-                else:
-                    retval2[key] = str(val)
-            return retval2
-        if isinstance(retval, list):
-            retval3: list[str | None] = []
-            for val in retval:
-                if np.isnan(val):
-                    retval3.append(None)
-                else:
-                    retval3.append(str(val))
-            return retval3
-
-        raise ModelExecutionException("Invalid data!")
+        return _initial_values2str(retval=retval)
 
 
 class ModelicaSystemDoE(ModelicaDoEOMC):
@@ -194,19 +187,20 @@ class ModelicaSystemCmd(ModelExecutionCmd):
             model_name=modelname,
         )
 
+        # path to the model executable; its existence is checked on the first call of get_exe()
+        self._path_exe = pathlib.Path(runpath) / f"{modelname}{_EXE_SUFFIX}"
+        self._path_exe_posix = self._path_exe.as_posix()
+        self._path_exe_checked = False
+
     def get_exe(self) -> pathlib.Path:
         """Get the path to the compiled model executable."""
 
-        path_run = pathlib.Path(self._runpath)
-        if platform.system() == "Windows":
-            path_exe = path_run / f"{self._model_name}.exe"
-        else:
-            path_exe = path_run / self._model_name
-
-        if not path_exe.exists():
-            raise ModelicaSystemError(f"Application file path not found: {path_exe}")
+        if not self._path_exe_checked:
+            if not self._path_exe.exists():
+                raise ModelicaSystemError(f"Application file path not found: {self._path_exe}")
+            self._path_exe_checked = True
 
-        return path_exe
+        return self._path_exe
 
     def get_cmd(self) -> list:
         """Get a list with the path to the executable and all command line args.
@@ -214,7 +208,9 @@ class ModelicaSystemCmd(ModelExecutionCmd):
         This can later be used as an argument for subprocess.run().
         """
 
-        cmdl = [self.get_exe().as_posix()] + self.get_cmd_args()
+        # check the executable via get_exe() but use the POSIX string defined in __init__()
+        self.get_exe()
+        cmdl = [self._path_exe_posix, *self.get_cmd_args()]
 
         return cmdl
 
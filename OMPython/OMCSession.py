@@ -30,6 +30,9 @@ from OMPython.om_session_omc import (
 # define logger using the current module name as ID
 logger = logging.getLogger(__name__)
 
+# OMC (Modelica) representation of boolean values
+_BOOL2STR: dict[bool, str] = {True: 'true', False: 'false'}
+
 
 class OMCSessionException(OMSessionException):
     """
@@ -67,18 +70,20 @@ class OMCSessionCmd:
 
         p = (expression, parsed)
 
-        if self._readonly and question != 'getErrorString':
-            # can use cache if readonly
-            if p in self._omc_cache:
-                return self._omc_cache[p]
+        # the cache is only used if readonly; getErrorString must always be evaluated
+        use_cache = self._readonly and question != 'getErrorString'
+
+        if use_cache and p in self._omc_cache:
+            return self._omc_cache[p]
 
         try:
             res = self._session.sendExpression(expression, parsed=parsed)
         except OMSessionException as ex:
             raise OMSessionException(f"OMC _ask() failed: {expression} (parsed={parsed})") from ex
 
-        # save response
-        self._omc_cache[p] = res
+        # save response - only if it can be used later on
+        if use_cache:
+            self._omc_cache[p] = res
 
         return res
 
@@ -205,7 +210,7 @@ class OMCSessionCmd:
         # get {$Code(....)} field
         # \{\$Code\((\S*\s*)*\)\}
         value = self._ask(question='getNthComponentModification', opt=[className, comp_id], parsed=False)
-        value = value.replace("{$Code(", "")
+        value = value.removeprefix("{$Code(")
         return value[:-3]
         # return self.re_Code.findall(value)
 
@@ -220,11 +225,12 @@ class OMCSessionCmd:
     # end getClassNames;
     def getClassNames(self, className=None, recursive=False, qualified=False, sort=False, builtin=False,
                       showProtected=False):
-        opt = [className] if className else [] + [f'recursive={str(recursive).lower()}',
-                                                  f'qualified={str(qualified).lower()}',
-                                                  f'sort={str(sort).lower()}',
-                                                  f'builtin={str(builtin).lower()}',
-                                                  f'showProtected={str(showProtected).lower()}']
+        opt = [className] if className else []
+        opt += [f'recursive={_BOOL2STR[bool(recursive)]}',
+                f'qualified={_BOOL2STR[bool(qualified)]}',
+                f'sort={_BOOL2STR[bool(sort)]}',
+                f'builtin={_BOOL2STR[bool(builtin)]}',
+                f'showProtected={_BOOL2STR[bool(showProtected)]}']
         return self._ask(question='getClassNames', opt=opt)
 
 
@@ -31,6 +31,7 @@ __license__ = """
 __status__ = "Prototype"
 __maintainer__ = "https://openmodelica.org"
 
+import re
 from typing import Any
 
 from pyparsing import (
@@ -47,6 +48,7 @@ from pyparsing import (
     opAssoc,
     Optional,
     QuotedString,
+    Regex,
     replace_with,
     StringEnd,
     Suppress,
@@ -117,15 +119,19 @@ NONE = (Keyword("NONE") + Suppress("(") + Suppress(")")).set_parse_action(replac
 SOME = (Suppress(Keyword("SOME")) + Suppress("(") + omcValue + Suppress(")"))
 
 omcString = QuotedString(quote_char='"', esc_char='\\', multiline=True).set_parse_action(convert_string)
-omcNumber = Combine(Optional('-') + ('0' | Word('123456789', nums)) +
-                    Optional('.' + Word(nums)) +
-                    Optional(Word('eE', exact=1) + Word(nums + '+-', nums)))
+# a number is matched by one regular expression; same definition as:
+# Combine(Optional('-') + ('0' | Word('123456789', nums)) + Optional('.' + Word(nums))
+#         + Optional(Word('eE', exact=1) + Word(nums + '+-', nums)))
+omcNumber = Regex(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][0-9+-][0-9]*)?')
 
 # ident = Word(alphas + "_", alphanums + "_") | Combine("'" + Word(alphanums + "!#$%&()*+,-./:;<>=?@[]^{}|~ ") + "'")
 ident = (Word(alphas + "_", alphanums + "_")
          | QuotedString(quote_char='\'', esc_char='\\').set_parse_action(convert_string2))
 fqident = Forward()
 fqident << ((ident + "." + fqident) | ident)
+# fast path for the common case of a fully qualified identifier without quoted identifiers or whitespace; if the
+# match is not the complete name (followed by an identifier character or a '.'), Combine(fqident) is used
+omcFqident = Regex(r'[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*(?![A-Za-z0-9_]|\s*\.)') | Combine(fqident)
 omcValues = DelimitedList(omcValue)
 omcTuple = Group(Suppress('(') + Optional(omcValues) + Suppress(')')).set_parse_action(convert_tuple)
 omcArray = Group(Suppress('{') + Optional(omcValues) + Suppress('}')).set_parse_action(convert_tuple)
@@ -142,7 +148,7 @@ omcValue << (omcString
              | TRUE
              | FALSE
              | NONE
-             | Combine(fqident))
+             | omcFqident)
 recordMember = DelimitedList(Group(ident + Suppress('=') + omcValue))
 omcRecord << Group(Suppress('record')
                    + Suppress(fqident)
@@ -156,7 +162,28 @@ omcGrammar = Optional(omcValue) + StringEnd()
 omcNumber.set_parse_action(convert_numbers)
 
 
+# results which are returned by om_parser_typed() without running the parser
+_SIMPLE_RESULTS: dict[str, Any] = {'': None, 'true': True, 'false': False, 'NONE()': None}
+# integer and float numbers as defined by omcNumber (with a valid exponent)
+_RE_INTEGER = re.compile(r'-?(?:0|[1-9][0-9]*)')
+_RE_FLOAT = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?')
+# string without escape sequences; tabs are excluded as pyparsing expands them to spaces
+_RE_STRING = re.compile(r'"[^"\\\t]*"')
+
+
 def om_parser_typed(string) -> Any:
+    # fast path for simple results (boolean, number, string without escape sequences, ...); the result is the same as
+    # the one of the parser (pyparsing skips the same whitespace characters)
+    value = string.strip(' \t\n\r')
+    if value in _SIMPLE_RESULTS:
+        return _SIMPLE_RESULTS[value]
+    if _RE_INTEGER.fullmatch(value):
+        return int(value)
+    if _RE_FLOAT.fullmatch(value):
+        return float(value)
+    if _RE_STRING.fullmatch(value):
+        return value[1:-1]
+
     res = omcGrammar.parse_string(string)
     if len(res) == 0:
         return None
@@ -5,6 +5,7 @@ Definition of needed tools to execute a compiled (binary) OpenModelica model.
 
 import ast
 import dataclasses
+import functools
 import logging
 import numbers
 import os
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 
 MODEL_EXECUTION_TIMEOUT: float = 300.0
 
+_SIMFLAGS_DEPRECATION_MSG: str = ("The argument 'simflags' is depreciated and will be removed in future versions; "
+                                  "please use 'simargs' instead")
+
 
 class ModelExecutionException(Exception):
     """
@@ -26,7 +30,68 @@ class ModelExecutionException(Exception):
     """
 
 
-@dataclasses.dataclass
+# types of override values which are accepted without the (slower) isinstance() check against numbers.Number
+_OVERRIDE_TYPES = frozenset((str, bool, int, float, type(None)))
+# decimal integer and float numbers which can be converted without ast.literal_eval() in ModelExecutionCmd.arg_set()
+_RE_OVERRIDE_INT = re.compile(pattern=r"[+-]?(?:0|[1-9][0-9]*)")
+_RE_OVERRIDE_FLOAT = re.compile(pattern=r"[+-]?[0-9]+\.[0-9]*(?:[eE][+-]?[0-9]+)?")
+
+# regular expression to extract the library path from the *.bat file generated for Windows
+_RE_BAT_PATH = re.compile(pattern=r"^SET PATH=([^%]*)", flags=re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _bat_library_path(path_bat: str, mtime_ns: int) -> str:
+    """
+    Extract the library path from the *.bat file of a model executable. The result is cached based on the path and the
+    modification time of the file as definition() is called for each run of the model (for example in a DoE).
+    """
+    cmd_library_path = ""
+
+    content = pathlib.Path(path_bat).read_text(encoding='utf-8')
+    for line in content.splitlines():
+        match = _RE_BAT_PATH.match(line)
+        if match:
+            cmd_library_path = match.group(1).strip(';')  # Remove any trailing semicolons
+
+    return cmd_library_path
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_simflags_cached(simflags: str) -> tuple[tuple[str, Optional[str | tuple[tuple[str, str], ...]]], ...]:
+    """
+    Parse a simflag definition and return the data as (immutable) tuple of (key, value) pairs. The value of the
+    override argument is stored as tuple of (key, value) pairs. The result is cached as the same simflags are often
+    used repeatedly (for example in a DoE).
+    """
+    simargs: dict[str, Optional[str | tuple[tuple[str, str], ...]]] = {}
+
+    for arg in simflags.split(' '):
+        if not arg:
+            continue
+        if arg[0] != '-':
+            raise ModelExecutionException(f"Invalid simulation flag: {arg}")
+        key, sep, override = arg[1:].partition('=')
+        if not sep:
+            simargs[key] = None
+        elif key == 'override':
+            override_dict = {}
+            for item in override.split(','):
+                okey, osep, oval = item.partition('=')
+                if '=' in oval:
+                    raise ModelExecutionException(f"Invalid value for '-override': {override}")
+                if not okey:
+                    continue
+                if not osep:
+                    raise ModelExecutionException(f"Invalid value for '-override': {override}")
+                override_dict[okey] = oval
+
+            simargs[key] = tuple(override_dict.items())
+
+    return tuple(simargs.items())
+
+
+@dataclasses.dataclass(slots=True)
 class ModelExecutionData:
     """
     Data class to store the command line data for running a model executable in the OMC environment.
@@ -60,39 +125,45 @@ class ModelExecutionData:
         Get the command line to run the model executable in the environment defined by the OMCProcess definition.
         """
 
-        cmdl = self.cmd_prefix
-        cmdl += [self.cmd_model_executable]
-        cmdl += self.cmd_args
-
-        return cmdl
+        # build a new list; cmd_prefix can be shared with the ModelExecutionCmd instance and must not be modified
+        return [*self.cmd_prefix, self.cmd_model_executable, *self.cmd_args]
 
     def run(self) -> int:
         """
         Run the model execution defined in this class.
         """
 
-        my_env = os.environ.copy()
+        # the environment is only modified if a library path is defined (Windows); else it is inherited (env=None)
+        my_env = None
         if isinstance(self.cmd_library_path, str):
-            my_env["PATH"] = self.cmd_library_path + os.pathsep + my_env["PATH"]
+            my_env = os.environ.copy()
+            # prepend the library path only if it is not already the first entry of PATH
+            path_prefix = self.cmd_library_path + os.pathsep
+            path_env = my_env.get("PATH", "")
+            if not path_env.startswith(path_prefix):
+                my_env["PATH"] = path_prefix + path_env
 
         cmdl = self.get_cmd()
 
         logger.debug("Run OM command %s in %s (timeout=%2fs)", repr(cmdl), self.cmd_path, self.cmd_timeout)
+        # the output of the model executable is only used for debug logging; discard it if it is not needed
+        log_stdout = logger.isEnabledFor(logging.DEBUG)
         try:
             cmdres = subprocess.run(
                 cmdl,
-                capture_output=True,
+                stdout=subprocess.PIPE if log_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 env=my_env,
                 cwd=self.cmd_cwd_local,
                 timeout=self.cmd_timeout,
                 check=True,
             )
-            stdout = cmdres.stdout.strip()
             stderr = cmdres.stderr.strip()
             returncode = cmdres.returncode
 
-            logger.debug("OM output for command %s:\n%s", repr(cmdl), stdout)
+            if log_stdout:
+                logger.debug("OM output for command %s:\n%s", repr(cmdl), cmdres.stdout.strip())
 
             if stderr:
                 raise ModelExecutionException(f"Error running model executable {repr(cmdl)}: {stderr}")
@@ -130,6 +201,14 @@ class ModelExecutionCmd:
         self._runpath = pathlib.PurePosixPath(runpath)
         self._model_name = model_name
 
+        # POSIX strings of the run path and the model executable; both are fixed and can be defined once
+        self._runpath_posix = self._runpath.as_posix()
+        if self._cmd_local and self._cmd_windows:
+            self._model_executable_posix = (self._runpath / f"{self._model_name}.exe").as_posix()
+        else:
+            # for Linux the paths to the needed libraries should be included in the executable (using rpath)
+            self._model_executable_posix = (self._runpath / self._model_name).as_posix()
+
         if timeout is None:
             # a separate timeout is defined here to allow the use of the class independent of the normal call chain via
             # classes derived from OMSession (OMSESSION_TIMEOUT)
@@ -142,6 +221,8 @@ class ModelExecutionCmd:
         # 'override' argument needs special handling, as it is a dict on its own saved as dict elements following the
         # structure: 'key' => 'key=value'
         self._arg_override: dict[str, str] = {}
+        # cached result of get_cmd_args(); reset on any change of the arguments
+        self._cmd_args: Optional[list[str]] = None
 
     def arg_set(
             self,
@@ -166,12 +247,19 @@ class ModelExecutionCmd:
             """
             # check oval for any string representations of numbers (or bool) and convert these to Python representations
             if isinstance(orval, str):
-                try:
-                    val_evaluated = ast.literal_eval(orval)
-                    if isinstance(val_evaluated, (numbers.Number, bool)):
-                        orval = val_evaluated
-                except (ValueError, SyntaxError):
-                    pass
+                # fast path for the common cases (decimal numbers and identifiers); same result as ast.literal_eval()
+                val_evaluated: Any = None
+                if _RE_OVERRIDE_INT.fullmatch(orval):
+                    val_evaluated = int(orval)
+                elif _RE_OVERRIDE_FLOAT.fullmatch(orval):
+                    val_evaluated = float(orval)
+                elif not orval.isidentifier() or orval in ('True', 'False'):
+                    try:
+                        val_evaluated = ast.literal_eval(orval)
+                    except (ValueError, SyntaxError):
+                        pass
+                if isinstance(val_evaluated, (numbers.Number, bool)):
+                    orval = val_evaluated
 
             if isinstance(orval, str):
                 val_str = orval.strip()
@@ -197,18 +285,18 @@ class ModelExecutionCmd:
                     raise ModelExecutionException("Invalid key for argument 'override': "
                                                   f"{repr(okey)} (type: {type(okey)})")
 
-                if not isinstance(oval, (str, bool, numbers.Number, type(None))):
+                if type(oval) not in _OVERRIDE_TYPES and not isinstance(oval, (str, numbers.Number)):
                     raise ModelExecutionException(f"Invalid input for 'override'.{repr(okey)}: "
                                                   f"{repr(oval)} (type: {type(oval)})")
 
                 if okey in self._arg_override:
                     if oval is None:
-                        logger.info(f"Remove model executable override argument: {repr(self._arg_override[okey])}")
+                        logger.info("Remove model executable override argument: %r", self._arg_override[okey])
                         del self._arg_override[okey]
                         continue
 
-                    logger.info(f"Update model executable override argument: {repr(okey)} = {repr(oval)} "
-                                f"(was: {repr(self._arg_override[okey])})")
+                    logger.info("Update model executable override argument: %r = %r (was: %r)",
+                                okey, oval, self._arg_override[okey])
 
                 if oval is not None:
                     self._arg_override[okey] = override2str(orkey=okey, orval=oval)
@@ -224,9 +312,10 @@ class ModelExecutionCmd:
             raise ModelExecutionException(f"Invalid argument value for {repr(key)}: {repr(val)} (type: {type(val)})")
 
         if key in self._args:
-            logger.warning(f"Override model executable argument: {repr(key)} = {repr(argval)} "
-                           f"(was: {repr(self._args[key])})")
+            logger.warning("Override model executable argument: %r = %r (was: %r)",
+                           key, argval, self._args[key])
         self._args[key] = argval
+        self._cmd_args = None
 
     def arg_get(self, key: str) -> Optional[str | dict[str, str | bool | numbers.Number]]:
         """
@@ -252,14 +341,11 @@ class ModelExecutionCmd:
         Get a list with the command arguments for the model executable.
         """
 
-        cmdl = []
-        for key in sorted(self._args):
-            if self._args[key] is None:
-                cmdl.append(f"-{key}")
-            else:
-                cmdl.append(f"-{key}={self._args[key]}")
+        if self._cmd_args is None:
+            self._cmd_args = [f"-{key}" if val is None else f"-{key}={val}" for key, val in sorted(self._args.items())]
 
-        return cmdl
+        # return a copy such that the cached data cannot be modified by the caller
+        return self._cmd_args.copy()
 
     def definition(self) -> ModelExecutionData:
         """
@@ -270,45 +356,29 @@ class ModelExecutionCmd:
         if not isinstance(result_file, str):
             result_file = (self._runpath / f"{self._model_name}.mat").as_posix()
 
-        # as this is the local implementation, pathlib.Path can be used
-        cmd_path = self._runpath
-
         cmd_library_path = None
         if self._cmd_local and self._cmd_windows:
-            cmd_library_path = ""
-
             # set the process environment from the generated .bat file in windows which should have all the dependencies
             # for this pathlib.PurePosixPath() must be converted to a pathlib.Path() object, i.e. WindowsPath
-            path_bat = pathlib.Path(cmd_path) / f"{self._model_name}.bat"
+            path_bat = pathlib.Path(self._runpath) / f"{self._model_name}.bat"
             if not path_bat.is_file():
                 raise ModelExecutionException("Batch file (*.bat) does not exist " + str(path_bat))
 
-            content = path_bat.read_text(encoding='utf-8')
-            for line in content.splitlines():
-                match = re.match(pattern=r"^SET PATH=([^%]*)", string=line, flags=re.IGNORECASE)
-                if match:
-                    cmd_library_path = match.group(1).strip(';')  # Remove any trailing semicolons
-            my_env = os.environ.copy()
-            my_env["PATH"] = cmd_library_path + os.pathsep + my_env["PATH"]
-
-            cmd_model_executable = cmd_path / f"{self._model_name}.exe"
-        else:
-            # for Linux the paths to the needed libraries should be included in the executable (using rpath)
-            cmd_model_executable = cmd_path / self._model_name
+            cmd_library_path = _bat_library_path(path_bat=str(path_bat), mtime_ns=path_bat.stat().st_mtime_ns)
 
         # define local(!) working directory
         cmd_cwd_local = None
         if self._cmd_local:
-            cmd_cwd_local = cmd_path.as_posix()
+            cmd_cwd_local = self._runpath_posix
 
         omc_run_data = ModelExecutionData(
-            cmd_path=cmd_path.as_posix(),
+            cmd_path=self._runpath_posix,
             cmd_model_name=self._model_name,
             cmd_args=self.get_cmd_args(),
             cmd_result_file=result_file,
             cmd_prefix=self._cmd_prefix,
             cmd_library_path=cmd_library_path,
-            cmd_model_executable=cmd_model_executable.as_posix(),
+            cmd_model_executable=self._model_executable_posix,
             cmd_cwd_local=cmd_cwd_local,
             cmd_timeout=self._timeout,
         )
@@ -323,36 +393,17 @@ class ModelExecutionCmd:
         The return data can be used as input for self.args_set().
         """
         warnings.warn(
-            message="The argument 'simflags' is depreciated and will be removed in future versions; "
-                    "please use 'simargs' instead",
+            message=_SIMFLAGS_DEPRECATION_MSG,
             category=DeprecationWarning,
             stacklevel=2,
         )
 
+        # the cached data is immutable; create new (mutable) dictionaries for the caller
         simargs: dict[str, Optional[str | dict[str, Any] | numbers.Number]] = {}
-
-        args = [s for s in simflags.split(' ') if s]
-        for arg in args:
-            if arg[0] != '-':
-                raise ModelExecutionException(f"Invalid simulation flag: {arg}")
-            arg = arg[1:]
-            parts = arg.split('=')
-            if len(parts) == 1:
-                simargs[parts[0]] = None
-            elif parts[0] == 'override':
-                override = '='.join(parts[1:])
-
-                override_dict = {}
-                for item in override.split(','):
-                    kv = item.split('=')
-                    if not 0 < len(kv) < 3:
-                        raise ModelExecutionException(f"Invalid value for '-override': {override}")
-                    if kv[0]:
-                        try:
-                            override_dict[kv[0]] = kv[1]
-                        except (KeyError, IndexError) as ex:
-                            raise ModelExecutionException(f"Invalid value for '-override': {override}") from ex
-
-                simargs[parts[0]] = override_dict
+        for key, val in _parse_simflags_cached(simflags=simflags):
+            if isinstance(val, tuple):
+                simargs[key] = dict(val)
+            else:
+                simargs[key] = val
 
         return simargs
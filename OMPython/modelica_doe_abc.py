@@ -195,19 +195,13 @@ class ModelicaDoEABC(metaclass=abc.ABCMeta):
                             f"and non-structural parameters: {sim_param_non_structural}")
                 resultfile = self._resultpath / resfilename
 
-                df_data = (
-                        {
-                            self.DICT_ID_STRUCTURE: idx_pc_structure,
-                        }
-                        | sim_param_structure
-                        | {
-                            self.DICT_ID_NON_STRUCTURE: idx_non_structural,
-                        }
-                        | sim_param_non_structural
-                        | {
-                            self.DICT_RESULT_AVAILABLE: False,
-                        }
-                )
+                df_data = {
+                    self.DICT_ID_STRUCTURE: idx_pc_structure,
+                    **sim_param_structure,
+                    self.DICT_ID_NON_STRUCTURE: idx_non_structural,
+                    **sim_param_non_structural,
+                    self.DICT_RESULT_AVAILABLE: False,
+                }
 
                 self._mod.setParameters(sim_param_non_structural)
                 mscmd = self._mod.simulate_cmd(
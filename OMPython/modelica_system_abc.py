@@ -27,6 +27,12 @@ from OMPython.om_session_abc import (
 # define logger using the current module name as ID
 logger = logging.getLogger(__name__)
 
+_SET_DEPRECATION_MSG: str = ("The definition of values to set should use a dictionary, "
+                             "i.e. {'key1': 'val1', 'key2': 'val2', ...}. Please convert all cases which "
+                             "use a string ('key=val') or list ['key1=val1', 'key2=val2', ...]")
+# translation table to remove all spaces from a string
+_STRIP_SPACES = str.maketrans('', '', ' ')
+
 
 class ModelicaSystemError(Exception):
     """
@@ -34,6 +40,15 @@ class ModelicaSystemError(Exception):
     """
 
 
+def _strip_spaces(str_in: str) -> str:
+    """
+    Remove all spaces from the given string; strings without spaces are returned without creating a new string.
+    """
+    if ' ' not in str_in:
+        return str_in
+    return str_in.translate(_STRIP_SPACES)
+
+
 @dataclass
 class LinearizationResult:
     """Modelica model linearization results.
@@ -759,41 +774,32 @@ class ModelicaSystemABC(metaclass=abc.ABCMeta):
         Convert raw input to a structured dictionary {'key1': 'value1', 'key2': 'value2'}.
         """
 
-        def prepare_str(str_in: str) -> dict[str, str]:
-            str_in = str_in.replace(" ", "")
-            key_val_list: list[str] = str_in.split("=")
-            if len(key_val_list) != 2:
-                raise ModelicaSystemError(f"Invalid 'key=value' pair: {str_in}")
-
-            input_data_from_str: dict[str, str] = {key_val_list[0]: key_val_list[1]}
-
-            return input_data_from_str
-
         input_data: dict[str, str] = {}
 
-        for input_arg in input_args:
-            if isinstance(input_arg, str):
-                warnings.warn(message="The definition of values to set should use a dictionary, "
-                                      "i.e. {'key1': 'val1', 'key2': 'val2', ...}. Please convert all cases which "
-                                      "use a string ('key=val') or list ['key1=val1', 'key2=val2', ...]",
-                              category=DeprecationWarning,
-                              stacklevel=3)
-                input_data = input_data | prepare_str(input_arg)
-            elif isinstance(input_arg, list):
-                warnings.warn(message="The definition of values to set should use a dictionary, "
-                                      "i.e. {'key1': 'val1', 'key2': 'val2', ...}. Please convert all cases which "
-                                      "use a string ('key=val') or list ['key1=val1', 'key2=val2', ...]",
+        if len(input_args) == 1 and type(input_args[0]) is dict:
+            # fast path for the recommended usage: a single dictionary
+            input_data.update(input_args[0])
+        elif input_args:
+            if any(isinstance(input_arg, (str, list)) for input_arg in input_args):
+                warnings.warn(message=_SET_DEPRECATION_MSG,
                               category=DeprecationWarning,
                               stacklevel=3)
 
-                for item in input_arg:
-                    if not isinstance(item, str):
-                        raise ModelicaSystemError(f"Invalid input data type for set*() function: {type(item)}!")
-                    input_data = input_data | prepare_str(item)
-            elif isinstance(input_arg, dict):
-                input_data = input_data | input_arg
-            else:
-                raise ModelicaSystemError(f"Invalid input data type for set*() function: {type(input_arg)}!")
+            for input_arg in input_args:
+                if isinstance(input_arg, dict):
+                    input_data.update(input_arg)
+                elif isinstance(input_arg, (str, list)):
+                    # (deprecated) input as 'key=value' string or as list of such strings
+                    for item in [input_arg] if isinstance(input_arg, str) else input_arg:
+                        if not isinstance(item, str):
+                            raise ModelicaSystemError(f"Invalid input data type for set*() function: {type(item)}!")
+                        key, sep, val = item.partition("=")
+                        key = _strip_spaces(key)
+                        if not sep or not key or "=" in val:
+                            raise ModelicaSystemError(f"Invalid 'key=value' pair: {item}")
+                        input_data[key] = _strip_spaces(val)
+                else:
+                    raise ModelicaSystemError(f"Invalid input data type for set*() function: {type(input_arg)}!")
 
         if len(input_kwargs):
             for key, val in input_kwargs.items():
@@ -801,7 +807,7 @@ class ModelicaSystemABC(metaclass=abc.ABCMeta):
                 if not isinstance(val, str):
                     # spaces have to be removed as setInput() could take list of tuples as input and spaces would
                     # result in an error on recreating the input data
-                    str_val = str(val).replace(' ', '')
+                    str_val = _strip_spaces(str(val))
                 else:
                     str_val = val
                 if ' ' in key or ' ' in str_val:
@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import abc
 import io
-import json
 import logging
 import os
 import pathlib
@@ -400,14 +399,16 @@ class OMCSessionABC(OMSessionABC, metaclass=abc.ABCMeta):
 
         logger.debug("sendExpression(expr='%r', parsed=%r)", str(expr), parsed)
 
-        loop = self._timeout_loop(timestep=0.05)
-        while next(loop):
+        # wait until the message can be sent, i.e. the connection to OMC is established (see zmq.IMMEDIATE); poll()
+        # returns as soon as this is the case instead of retrying the send in fixed time steps
+        sent = False
+        if self._omc_zmq.poll(timeout=int(self._timeout * 1000), flags=zmq.POLLOUT):
             try:
                 self._omc_zmq.send_string(str(expr), flags=zmq.NOBLOCK)
-                break
+                sent = True
             except zmq.error.Again:
                 pass
-        else:
+        if not sent:
             # in the deletion process, the content is cleared. Thus, any access to a class attribute must be checked
             try:
                 log_content = self.get_log()
@@ -626,9 +627,12 @@ class OMCSessionDockerABC(OMCSessionABC, metaclass=abc.ABCMeta):
         while next(loop):
             docker_top = subprocess.check_output(["docker", "top", docker_cid]).decode().strip()
             docker_process = None
+            if self._random_string not in docker_top:
+                # OMC not (yet) listed - no need to check the output line by line
+                continue
             for line in docker_top.split("\n"):
-                columns = line.split()
                 if self._random_string in line:
+                    columns = line.split()
                     try:
                         docker_process = DockerPopen(int(columns[1]))
                     except psutil.NoSuchProcess as ex:
@@ -700,10 +704,12 @@ class OMCSessionDockerABC(OMCSessionABC, metaclass=abc.ABCMeta):
         Get the server address of the OMC server running in a Docker container.
         """
         if self._docker_network == "separate" and isinstance(self._docker_container_id, str):
-            output = subprocess.check_output(["docker", "inspect", self._docker_container_id]).decode().strip()
-            address = json.loads(output)[0]["NetworkSettings"]["IPAddress"]
-            if not isinstance(address, str):
-                raise OMSessionException(f"Invalid docker server address: {address}!")
+            # let docker extract the address instead of parsing the complete JSON output of 'docker inspect'
+            address = subprocess.check_output(["docker", "inspect",
+                                               "--format", "{{.NetworkSettings.IPAddress}}",
+                                               self._docker_container_id]).decode().strip()
+            if not address:
+                raise OMSessionException(f"Invalid docker server address: {repr(address)}!")
             return address
 
         return None
@@ -1049,11 +1055,14 @@ class OMCSessionLocal(OMCSessionABC):
         loop = self._timeout_loop(timestep=0.1)
         while next(loop):
             omc_portfile_path = self._get_portfile_path()
-            if omc_portfile_path is not None and omc_portfile_path.is_file():
-                # Read the port file
-                with open(file=omc_portfile_path, mode='r', encoding="utf-8") as f_p:
-                    port = f_p.readline()
-                break
+            if omc_portfile_path is not None:
+                # Read the port file; no separate check if it exists, open() fails if it is not (yet) available
+                try:
+                    with open(file=omc_portfile_path, mode='r', encoding="utf-8") as f_p:
+                        port = f_p.readline()
+                    break
+                except FileNotFoundError:
+                    pass
             if port is not None:
                 break
         else:
@@ -60,3 +60,40 @@ def test_simflags(mscmd_firstorder):
         '-noRestart',
         '-override=a=1,x=3',
     ]
+
+
+def test_parse_simflags_cached():
+    simflags = "-noEventEmit -override=a=1,x=3"
+
+    with pytest.deprecated_call():
+        simargs1 = OMPython.ModelExecutionCmd.parse_simflags(simflags=simflags)
+    simargs1['override']['b'] = '2'
+
+    # the cached data must not be modified by changes of a previous result
+    with pytest.deprecated_call():
+        simargs2 = OMPython.ModelExecutionCmd.parse_simflags(simflags=simflags)
+    assert simargs2 == {
+        'noEventEmit': None,
+        'override': {'a': '1', 'x': '3'},
+    }
+
+
+def test_definition_get_cmd(tmp_path):
+    mecmd = OMPython.ModelExecutionCmd(
+        runpath=tmp_path,
+        cmd_prefix=['prefix'],
+        model_name='M',
+    )
+    mecmd.arg_set(key='noEventEmit')
+
+    cmd_definition = mecmd.definition()
+    cmd = [
+        'prefix',
+        (tmp_path / 'M').as_posix(),
+        '-noEventEmit',
+    ]
+
+    # repeated calls must not modify the (shared) command prefix
+    assert cmd_definition.get_cmd() == cmd
+    assert cmd_definition.get_cmd() == cmd
+    assert mecmd.definition().cmd_prefix == ['prefix']
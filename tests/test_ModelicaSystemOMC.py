@@ -89,6 +89,18 @@ def test_setParameters():
         mod.getParameters(["g", "thisParameterDoesNotExist"])
 
 
+def test_prepare_input_data_str():
+    prepare = OMPython.ModelicaSystemABC._prepare_input_data
+
+    with pytest.deprecated_call():
+        assert prepare(input_args=("x[1, 2] = 3",), input_kwargs={}) == {"x[1,2]": "3"}
+    with pytest.deprecated_call():
+        assert prepare(input_args=(["der( x)=1", " e = 1.5 "],), input_kwargs={}) == {"der(x)": "1", "e": "1.5"}
+    with pytest.deprecated_call():
+        with pytest.raises(OMPython.ModelicaSystemError):
+            prepare(input_args=(" =1",), input_kwargs={})
+
+
 def test_setSimulationOptions():
     omcs = OMPython.OMCSessionLocal()
     model_path_str = omcs.sendExpression("getInstallationDirectoryPath()") + "/share/doc/omc/testmodels"
@@ -27,6 +27,12 @@ def test_int():
 
 def test_float():
     assert type(parser('1.2e3')) == float
+    assert parser('-2.5e-3\n') == -2.5e-3
+
+
+def test_simple_str():
+    assert parser('"a b"\n') == "a b"
+    assert parser('"a\\"b"') == 'a"b'
 
 
 def test_dict():
@@ -39,6 +45,13 @@ def test_ident():
     assert parser('blabla2') == "blabla2"
 
 
+def test_fqident():
+    assert parser('Modelica.Blocks.Sources') == "Modelica.Blocks.Sources"
+    assert parser('{a.b, c}') == ("a.b", "c")
+    assert parser("a.'b c'.d") == "a.'b c'.d"
+    assert parser('a .b') == "a.b"
+
+
 def test_empty():
     assert parser('') is None
 